@@ -4,14 +4,20 @@ Coffee Chat Email Reply Assistant
 Web interface for generating meeting availability responses
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import (Flask, Response, copy_current_request_context, request, jsonify,
+                   send_from_directory, session)
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import datetime
-import pytz
+from zoneinfo import ZoneInfo
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow, Flow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import pickle
 import os.path
 import os
@@ -19,22 +25,50 @@ import re
 import json
 import base64
 import binascii
+import bisect
+import functools
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; Flask's stdlib json provider is used without it
+    orjson = None
+
 # Load environment variables from env file (local) or environment (cloud)
 load_dotenv('env')
 
-# If modifying these scopes, delete the file token.pickle.
+# If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
-TOKEN_PATH = os.getenv('GOOGLE_TOKEN_PATH', 'token.pickle')
+TOKEN_PATH = os.getenv('GOOGLE_TOKEN_PATH', 'token.json')
+# Pickled token written by older versions, next to TOKEN_PATH; converted on first use
+LEGACY_TOKEN_PATH = os.path.splitext(TOKEN_PATH)[0] + '.pickle'
 CLIENT_SECRETS_PATH = os.getenv('GOOGLE_CLIENT_SECRETS_PATH', 'credentials.json')
 
 # Timezone definitions
-ET = pytz.timezone('America/New_York')
-CST = pytz.timezone('America/Chicago')
-PST = pytz.timezone('America/Los_Angeles')
+ET = ZoneInfo('America/New_York')
+CST = ZoneInfo('America/Chicago')
+PST = ZoneInfo('America/Los_Angeles')
+
+# Resolved once so per-slot code never re-selects the tz object or its label
+_TZ_MAP = {'ET': ET, 'CST': CST, 'PST': PST}
+_TZ_ABBR = {'ET': 'EST', 'CST': 'CST', 'PST': 'PST'}
+
+# Date formats shared by the prompt context and the reply formatting
+DAY_HEADER_FORMAT = '%A, %B %d'
+FULL_DATE_FORMAT = '%A, %B %d, %Y'
+ISO_DATE_FORMAT = '%Y-%m-%d'
+
+# Browser cache lifetime for the single-page frontend served at /
+INDEX_MAX_AGE_SECONDS = 3600
 
 # Working hours constraints
 ET_START = 10  # 10am ET
@@ -45,7 +79,107 @@ LOCAL_END = 17   # 5pm local time (CST/PST)
 BUFFER_MINUTES = 30
 SLOT_INCREMENT = 30
 
+# (hour, minute) of every candidate slot in an ET working day
+_SLOT_OFFSETS = [
+    (hour, minute)
+    for hour in range(ET_START, ET_END)
+    for minute in range(0, 60, SLOT_INCREMENT)
+]
+# Seconds from midnight of each entry in _SLOT_OFFSETS
+_SLOT_OFFSET_SECONDS = [hour * 3600 + minute * 60 for hour, minute in _SLOT_OFFSETS]
+
+
+class _TTLCache:
+    """Thread-safe LRU cache of at most `size` entries, each fresh for `ttl` seconds.
+
+    Expired entries stay until evicted so callers can revalidate them (see lookup());
+    ttl=None never expires.
+    """
 
+    def __init__(self, size: int, ttl: Optional[float] = None):
+        self.size = size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, stored_at: float, now: float) -> bool:
+        return self.ttl is None or now - stored_at < self.ttl
+
+    def lookup(self, key):
+        """Return (value, fresh) for key, or (None, False) if it isn't cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+        value, stored_at = entry
+        return value, self._is_fresh(stored_at, time.monotonic())
+
+    def get(self, key):
+        """Return the value for key if cached and fresh, else None."""
+        value, fresh = self.lookup(key)
+        return value if fresh else None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return value
+
+    def evict(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def fresh_items(self):
+        """Fresh (key, value) pairs, most recently used first."""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._entries.items())
+        return [(key, value) for key, (value, stored_at) in reversed(entries)
+                if self._is_fresh(stored_at, now)]
+
+
+# Built Calendar services ({service, creds}), keyed by a fingerprint of the credentials
+_SERVICE_CACHE = _TTLCache(size=128)
+
+# One httplib2 connection pool per thread, reused by every Calendar request it makes
+_HTTP_LOCAL = threading.local()
+
+# Parsed busy times per (credential fingerprint, window), served as-is for BUSY_TIMES_TTL_SECONDS
+BUSY_TIMES_TTL_SECONDS = 60
+_BUSY_TIMES_CACHE = _TTLCache(size=64, ttl=BUSY_TIMES_TTL_SECONDS)
+
+# Connected /calendar/status results per credential fingerprint, reused for
+# CALENDAR_STATUS_TTL_SECONDS
+CALENDAR_STATUS_TTL_SECONDS = 30
+_CALENDAR_STATUS_CACHE = _TTLCache(size=128, ttl=CALENDAR_STATUS_TTL_SECONDS)
+
+# Credentials built from GOOGLE_CREDENTIALS, keyed by the raw env value
+_ENV_CREDS_CACHE: Dict[str, Any] = {'value': None, 'creds': None}
+_ENV_CREDS_LOCK = threading.Lock()
+
+# Last credentials loaded from TOKEN_PATH, reused until the file's mtime changes
+_TOKEN_CACHE: Dict[str, Any] = {'mtime': None, 'creds': None}
+
+# Successful OpenAI results, keyed by a digest of the prompt inputs
+_AI_CACHE = _TTLCache(size=512)
+
+# Process-wide OpenAI client, created on first use by _get_openai_client()
+_OPENAI_CLIENT: Optional[OpenAI] = None
+_OPENAI_CLIENT_LOCK = threading.Lock()
+
+# Runs OpenAI calls and /generate's calendar prep off the request thread so they overlap.
+# Two slots per request thread in a worker (gunicorn.conf.py), so neither waits for a free thread
+_AI_EXECUTOR = ThreadPoolExecutor(max_workers=2 * int(os.getenv('GUNICORN_THREADS', '8')))
+
+# Most drafts one /refine_batch call may queue, and most batch ids a session remembers
+MAX_REFINE_BATCH_ITEMS = 20
+MAX_SESSION_REFINE_BATCHES = 20
+
+
+@functools.lru_cache(maxsize=4)
 def _parse_google_credentials(value: str) -> Dict[str, Any]:
     raw_value = value.strip()
     if not raw_value:
@@ -77,7 +211,7 @@ def _client_config_from_env() -> Optional[Dict[str, Any]]:
             }
         }
 
-    if os.path.exists(CLIENT_SECRETS_PATH):
+    if _has_client_secrets():
         with open(CLIENT_SECRETS_PATH, 'r', encoding='utf-8') as client_file:
             return json.load(client_file)
 
@@ -114,7 +248,34 @@ def _log_credentials_status() -> None:
         print(f'GOOGLE_CREDENTIALS parse error: {exc}')
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Calls that pass stdlib json options (such as the session serializer's
+    object_hook) are handed to Flask's default provider.
+    """
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
+if orjson:
+    app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'coffee-chat-secret-key-2024')
 
 # Log credential status early for Render/production visibility
@@ -130,10 +291,38 @@ CORS(app, origins=[
 
 
 def _credentials_from_env() -> Optional[Credentials]:
+    """Return Credentials for GOOGLE_CREDENTIALS, reused until the env value changes.
+
+    A new Credentials object is always refreshed once; after that it is only
+    refreshed when its access token is no longer valid.
+    """
     creds_value = os.environ.get('GOOGLE_CREDENTIALS')
     if not creds_value:
         return None
 
+    with _ENV_CREDS_LOCK:
+        if _ENV_CREDS_CACHE['value'] == creds_value:
+            creds = _ENV_CREDS_CACHE['creds']
+            if not creds.valid:
+                _refresh_env_credentials(creds)
+            return creds
+
+        creds = _new_env_credentials(creds_value)
+        _ENV_CREDS_CACHE.update(value=creds_value, creds=creds)
+        return creds
+
+
+def _refresh_env_credentials(creds: Credentials) -> None:
+    try:
+        print("[DEBUG] Attempting to refresh token...")
+        creds.refresh(Request())
+        print("[DEBUG] Token refreshed successfully")
+    except Exception as refresh_error:
+        print(f"[ERROR] Token refresh failed: {refresh_error}")
+        raise ValueError(f"Failed to refresh token: {refresh_error}")
+
+
+def _new_env_credentials(creds_value: str) -> Credentials:
     creds_data = _parse_google_credentials(creds_value)
     required_fields = ['refresh_token', 'client_id', 'client_secret']
     missing = [field for field in required_fields if not creds_data.get(field)]
@@ -158,59 +347,196 @@ def _credentials_from_env() -> Optional[Credentials]:
     # Note: creds.expired might be False even if token is invalid, so we should try to refresh
     # if we have a refresh_token, regardless of the expired status
     if creds.refresh_token:
-        try:
-            print("[DEBUG] Attempting to refresh token...")
-            # Always refresh to ensure we have a valid token
-            creds.refresh(Request())
-            print("[DEBUG] Token refreshed successfully")
-        except Exception as refresh_error:
-            print(f"[ERROR] Token refresh failed: {refresh_error}")
-            raise ValueError(f"Failed to refresh token: {refresh_error}")
+        # Always refresh to ensure we have a valid token
+        _refresh_env_credentials(creds)
 
     return creds
 
 
-def _credentials_from_local_token() -> Optional[Credentials]:
-    if not os.path.exists(TOKEN_PATH):
-        return None
+# Checked on every call, not at import: `python app.py` only chdirs to its own
+# directory after import, and a token added while the app runs should be noticed
+def _has_local_token() -> bool:
+    return os.path.exists(TOKEN_PATH) or os.path.exists(LEGACY_TOKEN_PATH)
+
+
+def _has_client_secrets() -> bool:
+    return os.path.exists(CLIENT_SECRETS_PATH)
+
+
+def _save_local_token(creds: Credentials) -> None:
+    with open(TOKEN_PATH, 'w') as token_file:
+        token_file.write(creds.to_json())
+    _TOKEN_CACHE.update(mtime=os.stat(TOKEN_PATH).st_mtime, creds=creds)
+
+
+def _legacy_token_source() -> Optional[str]:
+    """Path of a pickled token left by older versions, if any.
+
+    That is TOKEN_PATH itself when GOOGLE_TOKEN_PATH still names the old pickle,
+    otherwise LEGACY_TOKEN_PATH when no TOKEN_PATH exists yet.
+    """
+    if os.path.exists(TOKEN_PATH):
+        with open(TOKEN_PATH, 'rb') as token:
+            # Pickles (protocol 2+) start with the PROTO opcode; JSON tokens start with '{'
+            return TOKEN_PATH if token.read(1) == b'\x80' else None
+    if os.path.exists(LEGACY_TOKEN_PATH):
+        return LEGACY_TOKEN_PATH
+    return None
+
 
-    with open(TOKEN_PATH, 'rb') as token:
+def _migrate_legacy_token() -> bool:
+    """Convert a pickled token from older versions to JSON at TOKEN_PATH, once.
+
+    The pickle is kept next to it with a .bak suffix.
+    """
+    source = _legacy_token_source()
+    if not source:
+        return False
+
+    print(f"[DEBUG] Migrating pickled token {source} to JSON at {TOKEN_PATH}...")
+    with open(source, 'rb') as token:
         creds = pickle.load(token)
+    os.replace(source, source + '.bak')
+    _save_local_token(creds)
+    return True
+
+
+def _credentials_from_local_token() -> Optional[Credentials]:
+    try:
+        mtime = os.stat(TOKEN_PATH).st_mtime
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime is not None and mtime == _TOKEN_CACHE['mtime']:
+        creds = _TOKEN_CACHE['creds']
+    elif _migrate_legacy_token():
+        # _save_local_token() cached the converted credentials
+        creds = _TOKEN_CACHE['creds']
+    elif mtime is None:
+        return None
+    else:
+        with open(TOKEN_PATH, 'r') as token:
+            creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
+        _TOKEN_CACHE.update(mtime=mtime, creds=creds)
 
     if creds and creds.expired and creds.refresh_token:
         creds.refresh(Request())
-        with open(TOKEN_PATH, 'wb') as token_file:
-            pickle.dump(creds, token_file)
+        _save_local_token(creds)
 
     return creds
 
 
 def _credentials_from_local_flow() -> Optional[Credentials]:
-    if not os.path.exists(CLIENT_SECRETS_PATH):
+    if not _has_client_secrets():
         return None
 
     flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRETS_PATH, SCOPES)
     creds = flow.run_local_server(port=0)
-
-    with open(TOKEN_PATH, 'wb') as token:
-        pickle.dump(creds, token)
+    _save_local_token(creds)
 
     return creds
 
 
+def _credentials_fingerprint(*parts: Optional[str]) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _session_credentials_fingerprint(session_creds: Dict[str, Any]) -> str:
+    """Fingerprint of every field in the session's credentials, access token included.
+
+    The refresh token alone can't key the cache: sessions without one would all collide.
+    """
+    return _credentials_fingerprint('session', json.dumps(session_creds, sort_keys=True))
+
+
+def _local_token_fingerprint() -> Optional[str]:
+    try:
+        mtime = os.path.getmtime(TOKEN_PATH)
+    except FileNotFoundError:
+        return None
+    return _credentials_fingerprint('local', TOKEN_PATH, str(mtime))
+
+
+def _cached_service(fingerprint: Optional[str]):
+    entry = _SERVICE_CACHE.get(fingerprint)
+    if not entry:
+        return None
+
+    # The service reads its credentials by reference, so refreshing them in
+    # place keeps the built service usable
+    creds = entry['creds']
+    if not creds.valid:
+        try:
+            if not creds.refresh_token:
+                raise ValueError('credentials expired without a refresh token')
+            print("[DEBUG] Refreshing credentials for cached Calendar service...")
+            creds.refresh(Request())
+        except Exception as e:
+            print(f"[ERROR] Dropping cached Calendar service: {e}")
+            _SERVICE_CACHE.evict(fingerprint)
+            return None
+
+    return entry['service']
+
+
+def _store_service(fingerprint: str, creds: Credentials, service):
+    _SERVICE_CACHE.put(fingerprint, {'service': service, 'creds': creds})
+    return service
+
+
+def _service_fingerprint(service) -> Optional[str]:
+    """Credential fingerprint a service is cached under, or None if it isn't in _SERVICE_CACHE."""
+    for fingerprint, entry in _SERVICE_CACHE.fresh_items():
+        if entry['service'] is service:
+            return fingerprint
+    return None
+
+
+def _thread_http() -> httplib2.Http:
+    """This thread's httplib2.Http, so its open connections survive between requests."""
+    http = getattr(_HTTP_LOCAL, 'http', None)
+    if http is None:
+        http = _HTTP_LOCAL.http = httplib2.Http()
+    return http
+
+
+def _build_calendar_service(creds: Credentials):
+    """Build a Calendar service that can be shared across request threads.
+
+    httplib2 connections are not thread-safe, so every API request is authorized
+    over the calling thread's own connection pool while the parsed discovery
+    document is reused.
+    """
+    def build_request(_http, *args, **kwargs):
+        return HttpRequest(AuthorizedHttp(creds, http=_thread_http()), *args, **kwargs)
+
+    # The Calendar discovery document ships with googleapiclient; no fetch or file cache needed
+    return build('calendar', 'v3', credentials=creds, requestBuilder=build_request,
+                 static_discovery=True, cache_discovery=False)
+
+
 def get_calendar_service():
     """Authenticate and return Google Calendar service.
 
     Supports three modes (in priority order):
     1. Multi-user web OAuth: Uses credentials from user's session (after /auth/connect)
     2. Single-user cloud: Uses GOOGLE_CREDENTIALS environment variable (legacy)
-    3. Local development: Uses credentials.json and token.pickle files
+    3. Local development: Uses credentials.json and token.json files
     """
     creds = None
 
     # MODE 1: Check for user-specific credentials in session (multi-user web OAuth)
     session_creds = session.get('google_credentials')
     if session_creds:
+        fingerprint = _session_credentials_fingerprint(session_creds)
+        service = _cached_service(fingerprint)
+        if service:
+            return service
+
         try:
             print("[DEBUG] Loading credentials from user session (multi-user mode)...")
             creds = Credentials(
@@ -228,17 +554,18 @@ def get_calendar_service():
                 creds.refresh(Request())
                 # Update session with new token
                 session['google_credentials']['token'] = creds.token
+                fingerprint = _session_credentials_fingerprint(session['google_credentials'])
                 print("[DEBUG] Token refreshed and updated in session")
 
             print("[DEBUG] Building Calendar API service with user credentials...")
-            service = build('calendar', 'v3', credentials=creds)
+            service = _build_calendar_service(creds)
 
             # Validate the service
             print("[DEBUG] Validating user credentials with test API call...")
             service.calendarList().list(maxResults=1).execute()
             print("[DEBUG] User credentials validated successfully!")
 
-            return service
+            return _store_service(fingerprint, creds, service)
         except Exception as e:
             print(f"[ERROR] Error loading user credentials from session: {e}")
             import traceback
@@ -250,6 +577,11 @@ def get_calendar_service():
     # MODE 2: Check for single-user cloud deployment credentials (legacy)
     google_creds_env = os.environ.get('GOOGLE_CREDENTIALS')
     if google_creds_env:
+        fingerprint = _credentials_fingerprint('env', google_creds_env)
+        service = _cached_service(fingerprint)
+        if service:
+            return service
+
         try:
             print("[DEBUG] Loading credentials from GOOGLE_CREDENTIALS environment variable (single-user mode)...")
             creds = _credentials_from_env()
@@ -258,14 +590,14 @@ def get_calendar_service():
                 return None
 
             print("[DEBUG] Building Calendar API service...")
-            service = build('calendar', 'v3', credentials=creds)
+            service = _build_calendar_service(creds)
 
             # Validate the service by making a simple API call
             print("[DEBUG] Validating credentials with test API call...")
             service.calendarList().list(maxResults=1).execute()
             print("[DEBUG] Credentials validated successfully!")
 
-            return service
+            return _store_service(fingerprint, creds, service)
         except ValueError as ve:
             print(f"[ERROR] Credential validation error: {ve}")
             import traceback
@@ -278,8 +610,19 @@ def get_calendar_service():
             return None
 
     # MODE 3: Local development - use file-based credentials
+    # The token file's mtime is part of the key so a rewritten token is picked up
+    if _has_local_token():
+        service = _cached_service(_local_token_fingerprint())
+        if service:
+            return service
+
     print("[DEBUG] No session or GOOGLE_CREDENTIALS found, trying local token file...")
-    creds = _credentials_from_local_token()
+    try:
+        creds = _credentials_from_local_token()
+    except Exception as e:
+        # An unreadable token is replaced by re-running the OAuth flow below
+        print(f"[ERROR] Could not load local token {TOKEN_PATH}: {e}")
+        creds = None
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -290,14 +633,19 @@ def get_calendar_service():
             creds = _credentials_from_local_flow()
 
         if creds:
-            with open(TOKEN_PATH, 'wb') as token:
-                pickle.dump(creds, token)
+            _save_local_token(creds)
 
     if not creds:
         print("[ERROR] Could not obtain valid credentials")
         return None
 
-    return build('calendar', 'v3', credentials=creds)
+    return _store_service(_local_token_fingerprint(), creds, _build_calendar_service(creds))
+
+
+def _has_stored_credentials() -> bool:
+    """Whether credentials exist that load without the interactive local OAuth flow."""
+    return bool(session.get('google_credentials') or os.environ.get('GOOGLE_CREDENTIALS') or
+                _has_local_token())
 
 
 def _credentials_missing_for_request() -> bool:
@@ -309,65 +657,176 @@ def _credentials_missing_for_request() -> bool:
     if os.environ.get('GOOGLE_CREDENTIALS'):
         return False
     # Check local development files
-    if os.path.exists(TOKEN_PATH):
-        return False
-    if os.path.exists(CLIENT_SECRETS_PATH):
+    if _has_local_token() or _has_client_secrets():
         return False
     return True
 
 
-def get_busy_times(service, start_date, end_date):
-    """Get all busy times from calendar"""
+def _event_timestamp(value: str) -> int:
+    """Epoch seconds for an event dateTime; fromisoformat() only accepts a 'Z' suffix from Python 3.11."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return int(datetime.datetime.fromisoformat(value).timestamp())
+
+
+def _fetch_busy_times(service, start_date, end_date, etag=None):
+    """Fetch and parse busy times (see get_busy_times).
+
+    Returns (busy_times, etag). busy_times is None when the calendar answered
+    304 Not Modified to the If-None-Match etag. An etag is only returned for
+    single-page results, since it does not cover later pages.
+    """
     time_min = start_date.isoformat()
     time_max = end_date.isoformat()
 
-    events_result = service.events().list(
-        calendarId='primary',
-        timeMin=time_min,
-        timeMax=time_max,
-        singleEvents=True,
-        orderBy='startTime'
-    ).execute()
+    buffer_seconds = BUFFER_MINUTES * 60
+    busy_starts = []
+    busy_ends = []
+    # orderBy='startTime' should return events sorted; only re-sort if it didn't
+    in_order = True
+    result_etag = None
+    page_token = None
+    while True:
+        # Only request the fields we read; times come back in UTC
+        events_request = service.events().list(
+            calendarId='primary',
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            orderBy='startTime',
+            showDeleted=False,
+            timeZone='UTC',
+            maxResults=2500,
+            fields='etag,items(start/dateTime,start/date,end/dateTime),nextPageToken',
+            pageToken=page_token
+        )
+        if etag and not page_token:
+            events_request.headers['If-None-Match'] = etag
 
-    events = events_result.get('items', [])
+        try:
+            events_result = events_request.execute()
+        except HttpError as e:
+            if e.resp.status == 304:
+                return None, etag
+            raise
+
+        for event in events_result.get('items', []):
+            if 'date' in event['start']:
+                continue
 
-    busy_times = []
-    for event in events:
-        if 'date' in event['start']:
-            continue
+            start_ts = _event_timestamp(event['start']['dateTime'])
+            end_ts = _event_timestamp(event['end']['dateTime'])
+
+            start_ts -= buffer_seconds
+            end_ts += buffer_seconds
+            if busy_starts and (start_ts, end_ts) < (busy_starts[-1], busy_ends[-1]):
+                in_order = False
+            busy_starts.append(start_ts)
+            busy_ends.append(end_ts)
+
+        if not page_token and not events_result.get('nextPageToken'):
+            result_etag = events_result.get('etag')
+
+        page_token = events_result.get('nextPageToken')
+        if not page_token:
+            break
 
-        start = datetime.datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00'))
-        end = datetime.datetime.fromisoformat(event['end']['dateTime'].replace('Z', '+00:00'))
+    if not in_order:
+        intervals = sorted(zip(busy_starts, busy_ends))
+        busy_starts = [start for start, _ in intervals]
+        busy_ends = [end for _, end in intervals]
+    return (busy_starts, busy_ends), result_etag
 
-        start_et = start.astimezone(ET)
-        end_et = end.astimezone(ET)
 
-        start_with_buffer = start_et - datetime.timedelta(minutes=BUFFER_MINUTES)
-        end_with_buffer = end_et + datetime.timedelta(minutes=BUFFER_MINUTES)
+def get_busy_times(service, start_date, end_date):
+    """Get all busy times from calendar, with BUFFER_MINUTES on either side.
 
-        busy_times.append((start_with_buffer, end_with_buffer))
+    Returns (busy_starts, busy_ends): parallel lists of epoch seconds, sorted by
+    start. Results are cached per credentials and window. Within BUSY_TIMES_TTL_SECONDS
+    they are returned directly; after that they are revalidated with the list's ETag
+    and only re-parsed if the calendar changed.
+    """
+    fingerprint = _service_fingerprint(service)
+    if fingerprint is None:
+        # Not a service from get_calendar_service(), so there is no credential to key on
+        busy_times, _ = _fetch_busy_times(service, start_date, end_date)
+        return busy_times
+
+    key = (fingerprint, start_date.isoformat(), end_date.isoformat())
+    entry, fresh = _BUSY_TIMES_CACHE.lookup(key)
+    if fresh:
+        return entry['busy_times']
+
+    # A fresh wider window (e.g. from /calendar/prefetch) already has every event in this one
+    if not entry:
+        covering = _covering_busy_times(fingerprint, start_date, end_date)
+        if covering:
+            return covering
+
+    busy_times, etag = _fetch_busy_times(service, start_date, end_date,
+                                         etag=entry['etag'] if entry else None)
+    if busy_times is None:
+        busy_times = entry['busy_times']
+
+    _BUSY_TIMES_CACHE.put(key, {
+        'start': start_date,
+        'end': end_date,
+        'busy_times': busy_times,
+        'etag': etag
+    })
 
     return busy_times
 
 
-def is_time_available(check_time, busy_times):
-    """Check if a given time slot is available"""
-    for busy_start, busy_end in busy_times:
-        if check_time >= busy_start and check_time < busy_end:
-            return False
-    return True
+def _covering_busy_times(fingerprint, start_date, end_date):
+    """Return fresh cached busy times for a window containing start_date..end_date, if any.
+
+    Events outside the requested window are left in; slot checks only look up
+    the intervals around each candidate time.
+    """
+    for (entry_fingerprint, _, _), entry in _BUSY_TIMES_CACHE.fresh_items():
+        if (entry_fingerprint == fingerprint and
+                entry['start'] <= start_date and end_date <= entry['end']):
+            return entry['busy_times']
+    return None
 
 
-def is_valid_for_timezone(time_et, target_tz):
-    """Check if the ET time falls within working hours for target timezone"""
+def index_busy_times(busy_starts, busy_ends):
+    """Return busy_ends as a running maximum, for binary search over busy_starts.
+
+    Entry i becomes the latest end of the first i+1 intervals, so overlapping
+    buffered events are still covered.
+    """
+    return list(itertools.accumulate(busy_ends, max))
+
+
+def is_time_available(check_ts, busy_starts, busy_ends):
+    """Check if the slot starting at epoch second check_ts is available (see index_busy_times)"""
+    idx = bisect.bisect_right(busy_starts, check_ts) - 1
+    return idx < 0 or check_ts >= busy_ends[idx]
+
+
+def get_timezone(name: str) -> ZoneInfo:
+    """Resolve a short code ('ET', 'CST', 'PST'), defaulting to PST.
+
+    Only whole-hour zones are supported: et_hours_for_timezone() gates slots by hour.
+    """
+    return _TZ_MAP.get(name, PST)
+
+
+def et_hours_for_timezone(day_et, target_tz):
+    """Return the [start, end) ET hours on day_et that are working hours in target timezone.
+
+    UTC offsets only change at 2am, so one conversion per day covers every slot.
+    """
     if target_tz == 'ET':
-        return True
+        return ET_START, ET_END
 
-    tz = CST if target_tz == 'CST' else PST
-    local_time = time_et.astimezone(tz)
+    tz = get_timezone(target_tz)
+    shift = day_et.astimezone(tz).utcoffset() - day_et.utcoffset()
+    shift_hours = int(shift.total_seconds() // 3600)
 
-    hour = local_time.hour
-    return LOCAL_START <= hour < LOCAL_END
+    return max(ET_START, LOCAL_START - shift_hours), min(ET_END, LOCAL_END - shift_hours)
 
 
 def find_available_meeting_slots(service, start_date, end_date, target_timezone='ET', meeting_duration=30):
@@ -376,88 +835,79 @@ def find_available_meeting_slots(service, start_date, end_date, target_timezone=
     Returns a list of start times where a meeting of meeting_duration can fit,
     with at least BUFFER_MINUTES before the next event.
     """
-    now = datetime.datetime.now(ET)
+    now_ts = datetime.datetime.now(ET).timestamp()
     required_duration = meeting_duration + BUFFER_MINUTES
-    busy_times = get_busy_times(service, start_date, end_date)
+    busy_starts, busy_ends = get_busy_times(service, start_date, end_date)
+    busy_ends = index_busy_times(busy_starts, busy_ends)
 
     # First, find all available 30-min slots
     all_available_slots = []
+    # Wall-clock minute of each available slot (day ordinal * 1440 + minute of day),
+    # so contiguity is an int comparison instead of tz-aware datetime arithmetic
+    slot_minutes = []
     current_date = start_date
 
     while current_date < end_date:
         if current_date.weekday() >= 5:
-            current_date += datetime.timedelta(days=1)
+            # Jump straight to the following Monday
+            current_date += datetime.timedelta(days=7 - current_date.weekday())
             continue
 
-        for hour in range(ET_START, ET_END):
-            for minute in [0, 30]:
-                check_time = current_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        day_minute = current_date.toordinal() * 1440
+        workday_start = current_date.replace(hour=ET_START, minute=0, second=0, microsecond=0)
+        hour_start, hour_end = et_hours_for_timezone(workday_start, target_timezone)
 
-                if check_time <= now:
-                    continue
+        # Candidates are checked as epoch seconds; only available slots become datetimes.
+        # Anchored at the start of the working day since DST switches happen at 2am.
+        day_ts = int(workday_start.timestamp()) - ET_START * 3600
 
-                if not is_time_available(check_time, busy_times):
-                    continue
+        for (hour, minute), offset_seconds in zip(_SLOT_OFFSETS, _SLOT_OFFSET_SECONDS):
+            if not hour_start <= hour < hour_end:
+                continue
 
-                if not is_valid_for_timezone(check_time, target_timezone):
-                    continue
+            check_ts = day_ts + offset_seconds
 
-                all_available_slots.append(check_time)
+            if check_ts <= now_ts:
+                continue
+
+            if not is_time_available(check_ts, busy_starts, busy_ends):
+                continue
+
+            all_available_slots.append(
+                current_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            )
+            slot_minutes.append(day_minute + hour * 60 + minute)
 
         current_date += datetime.timedelta(days=1)
 
     if not all_available_slots:
         return []
 
-    # Convert to a set for O(1) lookup
-    available_set = set(all_available_slots)
-
     # Find all valid meeting start times
-    # A start time is valid if all required slots (for meeting + buffer) are available
-    valid_start_times = []
+    # A start time is valid if all required slots (for meeting + buffer) are available.
+    # runs_forward[i] counts the consecutive available slots starting at slot i,
+    # filled in by a single sweep from the end of the (chronological) slot list.
     slots_needed = int(required_duration / SLOT_INCREMENT)
 
-    for slot in all_available_slots:
-        # Check if all required consecutive slots are available
-        all_slots_available = True
-        for i in range(slots_needed):
-            check_slot = slot + datetime.timedelta(minutes=i * SLOT_INCREMENT)
-            if check_slot not in available_set:
-                all_slots_available = False
-                break
-
-        if all_slots_available:
-            valid_start_times.append(slot)
-
-    return valid_start_times
-
-
-def format_slot_for_timezone(start_et, target_tz, meeting_duration):
-    """Format a meeting slot for display in target timezone."""
-    meeting_end_et = start_et + datetime.timedelta(minutes=meeting_duration)
-
-    if target_tz == 'ET':
-        start_local = start_et
-        meeting_end_local = meeting_end_et
-        tz_abbr = 'EST'
-    else:
-        tz = CST if target_tz == 'CST' else PST
-        start_local = start_et.astimezone(tz)
-        meeting_end_local = meeting_end_et.astimezone(tz)
-        tz_abbr = target_tz
-
-    date_str = start_local.strftime('%A, %B %d')
-    start_time = start_local.strftime('%I:%M %p').lstrip('0')
-    end_time = meeting_end_local.strftime('%I:%M %p').lstrip('0')
+    runs_forward = [1] * len(all_available_slots)
+    for i in range(len(all_available_slots) - 2, -1, -1):
+        if slot_minutes[i + 1] - slot_minutes[i] == SLOT_INCREMENT:
+            runs_forward[i] = runs_forward[i + 1] + 1
 
-    formatted = f"{date_str} from {start_time} to {end_time} {tz_abbr}"
+    return [
+        slot for slot, run_len in zip(all_available_slots, runs_forward)
+        if run_len >= slots_needed
+    ]
 
-    # Also get EST times for verification
-    est_start_time = start_et.strftime('%I:%M %p').lstrip('0')
-    est_end_time = meeting_end_et.strftime('%I:%M %p').lstrip('0')
-    est_str = f"{est_start_time} to {est_end_time} EST"
 
-    return formatted, est_str
+# Signature patterns for the sender's name, tried in order.
+# Common patterns: "Thank you,\nName", "Best,\nName", "Regards,\nName", etc.
+_SIGNATURE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in [
+        r'(?:Thank you|Thanks|Best|Regards|Cheers|Sincerely|Best regards|Kind regards|Warm regards)[,.]?\s*\n+\s*([A-Z][a-z]+)',
+        r'\n([A-Z][a-z]+)\s*$',  # Last line with a capitalized name
+    ]
+]
 
 
 def extract_sender_name_from_email(email_text):
@@ -466,41 +916,98 @@ def extract_sender_name_from_email(email_text):
     The sender is the person who wrote the email (signs at the bottom),
     NOT the person being addressed (Hi [Name]).
     """
-    # Look for signature patterns - the sender's name
-    # Common patterns: "Thank you,\nName", "Best,\nName", "Regards,\nName", etc.
-    signature_patterns = [
-        r'(?:Thank you|Thanks|Best|Regards|Cheers|Sincerely|Best regards|Kind regards|Warm regards)[,.]?\s*\n+\s*([A-Z][a-z]+)',
-        r'\n([A-Z][a-z]+)\s*$',  # Last line with a capitalized name
-    ]
-
-    for pattern in signature_patterns:
-        match = re.search(pattern, email_text, re.IGNORECASE | re.MULTILINE)
+    for pattern in _SIGNATURE_PATTERNS:
+        match = pattern.search(email_text)
         if match:
             return match.group(1)
 
     return None
 
 
+def _ai_cache_key(*parts) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+DateReference = namedtuple('DateReference', [
+    'today', 'today_str',
+    'next_monday', 'next_monday_str',
+    'next_friday', 'next_friday_str',
+    'saturday_str',
+])
+
+
+@functools.lru_cache(maxsize=1)
+def _date_reference(day):
+    """Compute the today-relative dates used for date ranges and the AI prompt."""
+    today = datetime.datetime.combine(day, datetime.time(), tzinfo=ET)
+
+    # Calculate next week's Monday for reference
+    days_until_monday = (7 - today.weekday()) % 7
+    if days_until_monday == 0:
+        days_until_monday = 7
+    next_monday = today + datetime.timedelta(days=days_until_monday)
+    next_friday = next_monday + datetime.timedelta(days=4)
+
+    return DateReference(
+        today=today,
+        today_str=today.strftime(FULL_DATE_FORMAT),
+        next_monday=next_monday,
+        next_monday_str=next_monday.strftime(ISO_DATE_FORMAT),
+        next_friday=next_friday,
+        next_friday_str=next_friday.strftime(ISO_DATE_FORMAT),
+        saturday_str=(next_friday + datetime.timedelta(days=1)).strftime(ISO_DATE_FORMAT),
+    )
+
+
+def today_reference():
+    """Return today's DateReference (midnight ET); recomputed only when the ET date changes."""
+    return _date_reference(datetime.datetime.now(ET).date())
+
+
+def _get_openai_client() -> OpenAI:
+    """Shared OpenAI client so its HTTP connection pool is reused across requests.
+
+    Created lazily so a missing OPENAI_API_KEY surfaces on first use, not at import.
+    """
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        with _OPENAI_CLIENT_LOCK:
+            if _OPENAI_CLIENT is None:
+                _OPENAI_CLIENT = OpenAI()
+    return _OPENAI_CLIENT
+
+
+def email_parse_key(email_text):
+    """Key for an email's AI parse; includes today's date since the prompt embeds it."""
+    return _ai_cache_key('parse', email_text, today_reference().today.date())
+
+
 def parse_email_with_ai(email_text):
-    """Use OpenAI to parse the email and extract meeting details."""
-    try:
-        client = OpenAI()
+    """Use OpenAI to parse the email and extract meeting details.
 
-        today = datetime.datetime.now(ET)
-        today_str = today.strftime('%A, %B %d, %Y')
+    Results are cached per email text and day, since the prompt embeds today's date.
+    """
+    ref = today_reference()
+    cache_key = email_parse_key(email_text)
+    cached = _AI_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
-        # Calculate next week's Monday for reference
-        days_until_monday = (7 - today.weekday()) % 7
-        if days_until_monday == 0:
-            days_until_monday = 7
-        next_monday = today + datetime.timedelta(days=days_until_monday)
-        next_monday_str = next_monday.strftime('%Y-%m-%d')
-        next_friday = next_monday + datetime.timedelta(days=4)
-        next_friday_str = next_friday.strftime('%Y-%m-%d')
+    try:
+        client = _get_openai_client()
+
+        today_str = ref.today_str
+        next_monday_str = ref.next_monday_str
+        next_friday_str = ref.next_friday_str
 
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             max_tokens=500,
+            response_format={"type": "json_object"},
             messages=[
                 {
                     "role": "user",
@@ -527,7 +1034,7 @@ Analyze this email and extract meeting scheduling information. Return ONLY a JSO
    - If no date mentioned, set to null
 
 5. "end_date": The day AFTER the last day they want to meet (YYYY-MM-DD format, exclusive)
-   - "next week" = the Saturday after next Friday ({(next_friday + datetime.timedelta(days=1)).strftime('%Y-%m-%d')})
+   - "next week" = the Saturday after next Friday ({ref.saturday_str})
    - "next Wednesday-Friday" = the Saturday after that Friday
    - If no date mentioned, set to null
 
@@ -544,16 +1051,9 @@ Return ONLY valid JSON, no explanation."""
             ]
         )
 
-        result_text = response.choices[0].message.content
-        # Clean up potential markdown formatting
-        if result_text.startswith('```'):
-            result_text = result_text.split('```')[1]
-            if result_text.startswith('json'):
-                result_text = result_text[4:]
-        result_text = result_text.strip()
-
-        result = json.loads(result_text)
-        return result
+        # JSON mode guarantees a bare JSON object, no markdown fences to strip
+        result = json.loads(response.choices[0].message.content)
+        return _AI_CACHE.put(cache_key, result)
     except Exception as e:
         print(f"AI parsing error: {e}")
         return None
@@ -561,8 +1061,13 @@ Return ONLY valid JSON, no explanation."""
 
 def generate_contextual_reply(original_email, sender_name, time_slots_text):
     """Generate a natural, contextual email reply using AI."""
+    cache_key = _ai_cache_key('reply', original_email, time_slots_text, sender_name)
+    cached = _AI_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        client = OpenAI()
+        client = _get_openai_client()
 
         response = client.chat.completions.create(
             model="gpt-4o-mini",
@@ -594,7 +1099,7 @@ Return ONLY the email text, no explanation."""
             ]
         )
 
-        return response.choices[0].message.content.strip()
+        return _AI_CACHE.put(cache_key, response.choices[0].message.content.strip())
     except Exception as e:
         print(f"AI reply generation error: {e}")
         # Fallback to simple template
@@ -614,24 +1119,19 @@ Candice"""
 
 def parse_date_range(range_type, custom_start=None, custom_end=None):
     """Parse date range from selection or custom dates"""
-    now = datetime.datetime.now(ET)
-    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    ref = today_reference()
+    today = ref.today
 
     # If custom dates are provided, use them
     if custom_start and custom_end:
         try:
-            start = datetime.datetime.strptime(custom_start, '%Y-%m-%d')
-            start = ET.localize(start)
-            end = datetime.datetime.strptime(custom_end, '%Y-%m-%d')
-            end = ET.localize(end)
+            start = datetime.datetime.strptime(custom_start, '%Y-%m-%d').replace(tzinfo=ET)
+            end = datetime.datetime.strptime(custom_end, '%Y-%m-%d').replace(tzinfo=ET)
             return start, end
         except:
             pass
 
-    days_until_monday = (7 - today.weekday()) % 7
-    if days_until_monday == 0:
-        days_until_monday = 7
-    next_monday = today + datetime.timedelta(days=days_until_monday)
+    next_monday = ref.next_monday
 
     if range_type == 'this_week':
         start = today + datetime.timedelta(days=1)
@@ -661,37 +1161,167 @@ def select_best_days(day_blocks, max_days=4):
     if len(day_blocks) <= max_days:
         return day_blocks
 
-    # Calculate total available time per day
-    day_scores = []
+    # Keep the days with the most total available time (ties go to the earlier day)
+    selected = heapq.nlargest(
+        max_days,
+        day_blocks.items(),
+        key=lambda item: sum(block['duration_minutes'] for block in item[1])
+    )
+
+    # Sort selected days chronologically
+    selected.sort(key=lambda x: x[0])
+
+    return {day: blocks for day, blocks in selected}
+
+
+def local_shift_table(slots, tz, meeting_length):
+    """Map each ET date in slots to the wall-clock shift from ET to tz.
+
+    The shift is only used when neither zone changes its UTC offset between the day's
+    first slot and last meeting end; other days map to None and need astimezone().
+    """
+    table = {}
+    for day, day_slots in itertools.groupby(slots, key=lambda slot: slot.date()):
+        first = last = next(day_slots)
+        for last in day_slots:
+            pass
+        last_end = last + meeting_length
+
+        first_local = first.astimezone(tz)
+        last_end_local = last_end.astimezone(tz)
+        # fold=1 means the day starts inside a repeated (fall-back) hour, which a plain
+        # shift would resolve to the first occurrence
+        if (first.utcoffset() == last_end.utcoffset() and not first_local.fold and
+                first_local.utcoffset() == last_end_local.utcoffset()):
+            table[day] = first_local.utcoffset() - first.utcoffset()
+        else:
+            table[day] = None
+    return table
+
+
+def merge_and_group_slots(slots, timezone, duration):
+    """Combine consecutive meeting start times into availability windows, grouped by local day.
+
+    Each slot is a potential meeting START time, in chronological order. Two slots are
+    consecutive if the second starts within SLOT_INCREMENT (30 min) of the previous window's
+    end. Windows are merged on epoch seconds; datetimes are only built for each window's
+    first and last slot. Days are inserted chronologically.
+    """
+    if not slots:
+        return {}
+
+    tz = get_timezone(timezone)
+    tz_abbr = _TZ_ABBR.get(timezone, timezone)
+    meeting_length = datetime.timedelta(minutes=duration)
+    length_seconds = duration * 60
+    gap_seconds = SLOT_INCREMENT * 60
+
+    if tz is ET:
+        def to_local(dt, et_day):
+            return dt
+    else:
+        # One offset lookup per day instead of converting every slot
+        shifts = local_shift_table(slots, tz, meeting_length)
+
+        def to_local(dt, et_day):
+            shift = shifts[et_day]
+            if shift is None:
+                return dt.astimezone(tz)
+            return (dt + shift).replace(tzinfo=tz)
+
+    starts = [int(slot.timestamp()) for slot in slots]
+    et_days = [slot.date() for slot in slots]
+    local_days = [to_local(slot, day).date() for slot, day in zip(slots, et_days)]
+
+    # Each window is (first slot index, index of the slot with the latest end, end epoch)
+    windows = []
+    first = last = 0
+    window_end = starts[0] + length_seconds
+    for i in range(1, len(starts)):
+        # Merge if on the same day and the new start is within SLOT_INCREMENT of the
+        # window's end (they overlap or touch since meetings are longer than the increment)
+        if (local_days[i] == local_days[first] and
+                -length_seconds <= starts[i] - window_end <= gap_seconds):
+            if starts[i] + length_seconds > window_end:
+                last = i
+                window_end = starts[i] + length_seconds
+            continue
+        windows.append((first, last, window_end))
+        first = last = i
+        window_end = starts[i] + length_seconds
+    windows.append((first, last, window_end))
+
+    def block(window):
+        first, last, window_end = window
+        start_et = slots[first]
+        end_et = slots[last] + meeting_length
+
+        return {
+            'start_local': to_local(start_et, et_days[first]),
+            'end_local': to_local(end_et, et_days[last]),
+            'start_et': start_et,
+            'end_et': end_et,
+            'tz_abbr': tz_abbr,
+            'duration_minutes': duration if last == first else (window_end - starts[first]) / 60
+        }
+
+    # Windows are chronological, so each day's windows are adjacent
+    return {
+        day: [block(window) for window in day_windows]
+        for day, day_windows in itertools.groupby(windows, key=lambda window: local_days[window[0]])
+    }
+
+
+# "9:00 AM"-style labels for every minute of the day, matching strftime('%I:%M %p').lstrip('0')
+_TIME_LABELS = [
+    f"{hour % 12 or 12}:{minute:02d} {'PM' if hour >= 12 else 'AM'}"
+    for hour in range(24)
+    for minute in range(60)
+]
+
+
+def format_time(dt):
+    """Format as e.g. "9:00 AM" via a table lookup instead of strftime."""
+    return _TIME_LABELS[dt.hour * 60 + dt.minute]
+
+
+def format_day_blocks(day_blocks):
+    """Format each day's windows as one display line (day_blocks is in chronological order)."""
+    final_blocks = []
     for day_date, blocks in day_blocks.items():
-        total_minutes = 0
-        for block in blocks:
-            duration = (block['end_local'] - block['start_local']).total_seconds() / 60
-            total_minutes += duration
-        day_scores.append((day_date, total_minutes, blocks))
 
-    # Sort by total available time (most available first)
-    day_scores.sort(key=lambda x: x[1], reverse=True)
+        # Format the day string once
+        date_str = day_date.strftime(DAY_HEADER_FORMAT)
+        tz_abbr = blocks[0]['tz_abbr']
 
-    # Take top days but try to spread them out
-    selected = []
-    selected_dates = []
+        # Collect all time ranges for this day
+        time_ranges = []
+        est_ranges = []
+        for cb in blocks:
+            time_ranges.append(f"{format_time(cb['start_local'])} to {format_time(cb['end_local'])}")
+            est_ranges.append(f"{format_time(cb['start_et'])} to {format_time(cb['end_et'])}")
 
-    for day_date, score, blocks in day_scores:
-        if len(selected) >= max_days:
-            break
-        selected.append((day_date, blocks))
-        selected_dates.append(day_date)
+        # Combine into single line: "Friday, February 13 from 10:00 AM to 10:30 AM, 3:00 PM to 5:30 PM EST"
+        time_str = ", ".join(time_ranges)
+        local_format = f"{date_str} from {time_str} {tz_abbr}"
 
-    # Sort selected days chronologically
-    selected.sort(key=lambda x: x[0])
+        est_str = ", ".join(est_ranges)
+        est_format = f"{est_str} EST"
 
-    return {day: blocks for day, blocks in selected}
+        final_blocks.append({
+            'local': local_format,
+            'est': est_format,
+            'start_iso': blocks[0]['start_et'].isoformat()
+        })
+
+    return final_blocks
 
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    # The page has no template variables, so it is sent as a static file (with an
+    # ETag for revalidation) instead of being rendered through Jinja
+    return send_from_directory(app.template_folder, 'index.html', max_age=INDEX_MAX_AGE_SECONDS)
 
 
 @app.route('/auth/connect')
@@ -811,11 +1441,15 @@ def auth_callback():
         }
 
         # Validate credentials by making a test API call
-        service = build('calendar', 'v3', credentials=credentials)
+        service = _build_calendar_service(credentials)
         calendar_list = service.calendarList().list(maxResults=1).execute()
 
         print("[DEBUG] Credentials validated successfully!")
 
+        # Reuse the validated service for this user's next request
+        _store_service(_session_credentials_fingerprint(session['google_credentials']),
+                       credentials, service)
+
         # Clean up session state
         session.pop('oauth_state', None)
         session.pop('oauth_redirect_uri', None)
@@ -865,10 +1499,30 @@ def generate_reply():
 
     email_text = data.get('email_text', '')
 
-    # Try to parse email with AI first
+    # Clarification round-trips resubmit the same email; reuse its parse from the session
     ai_parsed = None
+    ai_future = None
+    email_hash = None
     if email_text.strip():
-        ai_parsed = parse_email_with_ai(email_text)
+        email_hash = email_parse_key(email_text)
+        if session.get('email_hash') == email_hash:
+            ai_parsed = session.get('ai_parsed')
+        else:
+            # Parse the email with AI in the background while the calendar service is
+            # prepared; both are network-bound and independent of each other
+            ai_future = _AI_EXECUTOR.submit(parse_email_with_ai, email_text)
+
+    # While the parse runs, prepare the calendar service too, but only from stored
+    # credentials: a request that ends in clarification must not start the OAuth flow
+    calendar_future = None
+    if ai_future and _has_stored_credentials():
+        calendar_future = _AI_EXECUTOR.submit(copy_current_request_context(get_calendar_service))
+
+    if ai_future:
+        ai_parsed = ai_future.result()
+        if ai_parsed:
+            session['email_hash'] = email_hash
+            session['ai_parsed'] = ai_parsed
 
     # Track what fields are missing and need clarification
     missing_fields = []
@@ -934,6 +1588,8 @@ def generate_reply():
 
     # If there are missing required fields, return for clarification
     if missing_fields:
+        if calendar_future:
+            calendar_future.cancel()
         return jsonify({
             'needs_clarification': True,
             'missing_fields': missing_fields,
@@ -942,13 +1598,17 @@ def generate_reply():
 
     date_range = data.get('date_range', 'two_weeks')
 
-    # Get calendar service
-    if _credentials_missing_for_request():
+    # Get calendar service, using the one prepared alongside the AI parse if any;
+    # result() re-raises any error from that preparation here
+    if calendar_future:
+        service = calendar_future.result()
+    elif _credentials_missing_for_request():
         return jsonify({
             'error': 'MISSING: GOOGLE_CREDENTIALS'
         }), 400
+    else:
+        service = get_calendar_service()
 
-    service = get_calendar_service()
     if not service:
         return jsonify({
             'error': 'Calendar not connected. GOOGLE_CREDENTIALS is set but could not be loaded. Verify refresh_token/client_id/client_secret.'
@@ -967,106 +1627,14 @@ def generate_reply():
             'error': f'No available slots found for {duration}-minute meetings with 30-min buffer.'
         }), 400
 
-    # Format slots for display
-    formatted_blocks = []
-    for start in slots:
-        local_format, est_format = format_slot_for_timezone(start, timezone, duration)
-        formatted_blocks.append({
-            'local': local_format,
-            'est': est_format,
-            'start_iso': start.isoformat(),
-            'start_et': start
-        })
-
-    # Combine consecutive/overlapping slots on the same day into continuous availability windows
-    # Each slot is a potential meeting START time. Two slots are consecutive if the second
-    # starts within SLOT_INCREMENT (30 min) of the first.
-    combined_blocks = []
-    for block in formatted_blocks:
-        start_et = block['start_et']
-        # The meeting would end at start + duration
-        meeting_end_et = start_et + datetime.timedelta(minutes=duration)
-
-        # Convert to target timezone for grouping
-        if timezone == 'ET':
-            start_local = start_et
-            end_local = meeting_end_et
-            tz_abbr = 'EST'
-        else:
-            tz = CST if timezone == 'CST' else PST
-            start_local = start_et.astimezone(tz)
-            end_local = meeting_end_et.astimezone(tz)
-            tz_abbr = timezone
-
-        # Check if this slot can be merged with the previous one
-        # Slots are consecutive if on the same day and the new start is within SLOT_INCREMENT of previous end
-        # (meaning they overlap or touch since meetings are longer than the increment)
-        if combined_blocks:
-            prev = combined_blocks[-1]
-            time_gap = (start_local - prev['end_local']).total_seconds() / 60
-
-            # Same day and slots are within SLOT_INCREMENT minutes (consecutive availability)
-            if (prev['end_local'].date() == start_local.date() and
-                time_gap <= SLOT_INCREMENT and time_gap >= -duration):
-                # Merge: extend the end time if this slot ends later
-                if end_local > prev['end_local']:
-                    combined_blocks[-1]['end_local'] = end_local
-                    combined_blocks[-1]['end_et'] = meeting_end_et
-                continue
-
-        combined_blocks.append({
-            'start_local': start_local,
-            'end_local': end_local,
-            'start_et': start_et,
-            'end_et': meeting_end_et,
-            'tz_abbr': tz_abbr
-        })
-
-    # Group blocks by day
-    day_blocks = {}
-    for cb in combined_blocks:
-        day_date = cb['start_local'].date()
-        if day_date not in day_blocks:
-            day_blocks[day_date] = []
-        day_blocks[day_date].append(cb)
+    # Combine consecutive slots into availability windows, grouped by day
+    day_blocks = merge_and_group_slots(slots, timezone, duration)
 
     # Select best 4 days if more than 4 available
     if len(day_blocks) > 4:
         day_blocks = select_best_days(day_blocks, max_days=4)
 
-    # Flatten back and format - combine multiple time ranges on same day
-    final_blocks = []
-    for day_date in sorted(day_blocks.keys()):
-        blocks = day_blocks[day_date]
-
-        # Format the day string once
-        date_str = blocks[0]['start_local'].strftime('%A, %B %d')
-        tz_abbr = blocks[0]['tz_abbr']
-
-        # Collect all time ranges for this day
-        time_ranges = []
-        est_ranges = []
-        for cb in blocks:
-            start_time = cb['start_local'].strftime('%I:%M %p').lstrip('0')
-            end_time = cb['end_local'].strftime('%I:%M %p').lstrip('0')
-            time_ranges.append(f"{start_time} to {end_time}")
-
-            est_start = cb['start_et'].strftime('%I:%M %p').lstrip('0')
-            est_end = cb['end_et'].strftime('%I:%M %p').lstrip('0')
-            est_ranges.append(f"{est_start} to {est_end}")
-
-        # Combine into single line: "Friday, February 13 from 10:00 AM to 10:30 AM, 3:00 PM to 5:30 PM EST"
-        time_str = ", ".join(time_ranges)
-        local_format = f"{date_str} from {time_str} {tz_abbr}"
-
-        est_str = ", ".join(est_ranges)
-        est_format = f"{est_str} EST"
-
-        final_blocks.append({
-            'local': local_format,
-            'est': est_format,
-            'start_iso': blocks[0]['start_et'].isoformat()
-        })
+    final_blocks = format_day_blocks(day_blocks)
 
     # Generate email reply using AI for natural, contextual tone
     time_slots_text = "\n".join([f"• {b['local']}" for b in final_blocks])
@@ -1082,18 +1650,15 @@ def generate_reply():
     })
 
 
-def generate_compose_email(recipient_name, context, time_slots_text):
-    """Generate a natural outbound email requesting a meeting using AI."""
-    try:
-        client = OpenAI()
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=500,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"""Write a friendly, natural email to request a meeting.
+def compose_request_body(recipient_name, context, time_slots_text):
+    """Chat completion request body for an outbound meeting request email."""
+    return {
+        "model": "gpt-4o-mini",
+        "max_tokens": 500,
+        "messages": [
+            {
+                "role": "user",
+                "content": f"""Write a friendly, natural email to request a meeting.
 
 RECIPIENT: {recipient_name}
 PURPOSE/CONTEXT: {context}
@@ -1112,15 +1677,13 @@ INSTRUCTIONS:
 - Don't be overly formal or stiff
 
 Return ONLY the email text, no explanation."""
-                }
-            ]
-        )
+            }
+        ]
+    }
 
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"AI compose generation error: {e}")
-        # Fallback to simple template
-        return f"""Hi {recipient_name},
+
+def _compose_fallback(recipient_name, context, time_slots_text):
+    return f"""Hi {recipient_name},
 
 I hope you're doing well! {context}
 
@@ -1134,6 +1697,22 @@ Best,
 Candice"""
 
 
+def generate_compose_email(recipient_name, context, time_slots_text):
+    """Generate a natural outbound email requesting a meeting using AI."""
+    try:
+        client = _get_openai_client()
+
+        response = client.chat.completions.create(
+            **compose_request_body(recipient_name, context, time_slots_text)
+        )
+
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print(f"AI compose generation error: {e}")
+        # Fallback to simple template
+        return _compose_fallback(recipient_name, context, time_slots_text)
+
+
 @app.route('/compose', methods=['POST'])
 def compose_email():
     """Generate an outbound meeting request email."""
@@ -1170,94 +1749,14 @@ def compose_email():
             'error': f'No available slots found for {duration}-minute meetings with 30-min buffer.'
         }), 400
 
-    # Format slots for display (reuse the same logic as generate_reply)
-    formatted_blocks = []
-    for start in slots:
-        local_format, est_format = format_slot_for_timezone(start, timezone, duration)
-        formatted_blocks.append({
-            'local': local_format,
-            'est': est_format,
-            'start_iso': start.isoformat(),
-            'start_et': start
-        })
-
-    # Combine consecutive/overlapping slots
-    combined_blocks = []
-    for block in formatted_blocks:
-        start_et = block['start_et']
-        meeting_end_et = start_et + datetime.timedelta(minutes=duration)
-
-        if timezone == 'ET':
-            start_local = start_et
-            end_local = meeting_end_et
-            tz_abbr = 'EST'
-        else:
-            tz = CST if timezone == 'CST' else PST
-            start_local = start_et.astimezone(tz)
-            end_local = meeting_end_et.astimezone(tz)
-            tz_abbr = timezone
-
-        if combined_blocks:
-            prev = combined_blocks[-1]
-            time_gap = (start_local - prev['end_local']).total_seconds() / 60
-
-            if (prev['end_local'].date() == start_local.date() and
-                time_gap <= SLOT_INCREMENT and time_gap >= -duration):
-                if end_local > prev['end_local']:
-                    combined_blocks[-1]['end_local'] = end_local
-                    combined_blocks[-1]['end_et'] = meeting_end_et
-                continue
-
-        combined_blocks.append({
-            'start_local': start_local,
-            'end_local': end_local,
-            'start_et': start_et,
-            'end_et': meeting_end_et,
-            'tz_abbr': tz_abbr
-        })
-
-    # Group blocks by day
-    day_blocks = {}
-    for cb in combined_blocks:
-        day_date = cb['start_local'].date()
-        if day_date not in day_blocks:
-            day_blocks[day_date] = []
-        day_blocks[day_date].append(cb)
+    # Combine consecutive slots into availability windows, grouped by day
+    day_blocks = merge_and_group_slots(slots, timezone, duration)
 
     # Select best 4 days if more than 4 available
     if len(day_blocks) > 4:
         day_blocks = select_best_days(day_blocks, max_days=4)
 
-    # Flatten back and format
-    final_blocks = []
-    for day_date in sorted(day_blocks.keys()):
-        blocks = day_blocks[day_date]
-
-        date_str = blocks[0]['start_local'].strftime('%A, %B %d')
-        tz_abbr = blocks[0]['tz_abbr']
-
-        time_ranges = []
-        est_ranges = []
-        for cb in blocks:
-            start_time = cb['start_local'].strftime('%I:%M %p').lstrip('0')
-            end_time = cb['end_local'].strftime('%I:%M %p').lstrip('0')
-            time_ranges.append(f"{start_time} to {end_time}")
-
-            est_start = cb['start_et'].strftime('%I:%M %p').lstrip('0')
-            est_end = cb['end_et'].strftime('%I:%M %p').lstrip('0')
-            est_ranges.append(f"{est_start} to {est_end}")
-
-        time_str = ", ".join(time_ranges)
-        local_format = f"{date_str} from {time_str} {tz_abbr}"
-
-        est_str = ", ".join(est_ranges)
-        est_format = f"{est_str} EST"
-
-        final_blocks.append({
-            'local': local_format,
-            'est': est_format,
-            'start_iso': blocks[0]['start_et'].isoformat()
-        })
+    final_blocks = format_day_blocks(day_blocks)
 
     # Generate compose email using AI
     time_slots_text = "\n".join([f"• {b['local']}" for b in final_blocks])
@@ -1271,6 +1770,151 @@ def compose_email():
     })
 
 
+# Fixed refine instructions, sent as the system message so every call shares the same prefix
+REFINE_SYSTEM_PROMPT = (
+    "You revise email drafts. The user message is JSON with \"draft\" and \"feedback\". "
+    "Apply the feedback to the draft and return ONLY the revised email text. "
+    "Keep the structure and time slots unless the feedback asks to change them."
+)
+# A refine's output budget stays within these; the floor leaves room for feedback such as
+# "add an agenda" that grows a short draft well beyond its own length
+REFINE_MIN_TOKENS = 400
+REFINE_MAX_TOKENS = 1000
+
+
+def refine_max_tokens(current_reply, feedback):
+    """Output budget for a refine: room for the draft and feedback to roughly double (~4 chars per token)."""
+    estimate = 200 + (len(current_reply) + len(feedback)) // 2
+    return min(REFINE_MAX_TOKENS, max(REFINE_MIN_TOKENS, estimate))
+
+
+def refine_request_body(current_reply, feedback, max_tokens=None):
+    """Chat completion request body for refining a draft based on feedback."""
+    return {
+        "model": "gpt-4o-mini",
+        "max_tokens": max_tokens or refine_max_tokens(current_reply, feedback),
+        "messages": [
+            {"role": "system", "content": REFINE_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": json.dumps({"feedback": feedback, "draft": current_reply}, ensure_ascii=False)
+            }
+        ]
+    }
+
+
+def complete_truncated_refine(current_reply, feedback, partial_reply):
+    """Result for a refine whose reply hit its token budget.
+
+    Regenerated once with REFINE_MAX_TOKENS if the budget was smaller; a reply
+    that still doesn't fit is returned with "truncated": true.
+    """
+    if refine_max_tokens(current_reply, feedback) < REFINE_MAX_TOKENS:
+        client = _get_openai_client()
+        response = client.chat.completions.create(
+            **refine_request_body(current_reply, feedback, max_tokens=REFINE_MAX_TOKENS)
+        )
+        choice = response.choices[0]
+        if choice.finish_reason != 'length':
+            return {'reply': choice.message.content.strip()}
+        partial_reply = choice.message.content.strip()
+
+    print(f"[DEBUG] Refined reply truncated at {REFINE_MAX_TOKENS} tokens")
+    return {'reply': partial_reply, 'truncated': True}
+
+
+def stream_refined_reply(current_reply, feedback):
+    """Yield the refined draft as Server-Sent Events while it is being generated.
+
+    Each event carries {"delta": text}; the stream ends with {"done": true, "reply": full_text}
+    or {"error": message}. If the budget cut the draft off, the final "reply" comes from
+    complete_truncated_refine() and replaces the streamed text.
+    """
+    def event(payload):
+        return f"data: {json.dumps(payload)}\n\n"
+
+    try:
+        client = _get_openai_client()
+        stream = client.chat.completions.create(stream=True, **refine_request_body(current_reply, feedback))
+
+        parts = []
+        finish_reason = None
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+            if delta:
+                parts.append(delta)
+                yield event({'delta': delta})
+
+        reply = ''.join(parts).strip()
+        if finish_reason == 'length':
+            yield event({'done': True, **complete_truncated_refine(current_reply, feedback, reply)})
+        else:
+            yield event({'done': True, 'reply': reply})
+    except Exception as e:
+        yield event({'error': f'AI refinement failed: {str(e)}'})
+
+
+def submit_refine_batch(items):
+    """Submit refine requests ({current_reply, feedback} dicts) to the OpenAI Batch API.
+
+    Batch requests are billed at half price but may take up to 24 hours.
+    Returns the batch id; collect results with get_refine_batch_results().
+    """
+    client = _get_openai_client()
+
+    lines = [
+        json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": refine_request_body(item.get('current_reply', ''), item.get('feedback', ''))
+        })
+        for i, item in enumerate(items)
+    ]
+    batch_file = client.files.create(
+        file=('refine_batch.jsonl', '\n'.join(lines).encode('utf-8')),
+        purpose='batch'
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint='/v1/chat/completions',
+        completion_window='24h'
+    )
+    return batch.id
+
+
+def get_refine_batch_results(batch_id, item_count):
+    """Return (status, replies) for a refine batch of item_count drafts.
+
+    replies is None until the batch has completed, then a list in submission
+    order with None for any request that failed.
+    """
+    client = _get_openai_client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != 'completed':
+        return batch.status, None
+
+    # The submitter's own count: batch.request_counts is unset while a batch validates
+    replies = [None] * item_count
+    if batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get('response') or {}
+            if response.get('status_code') == 200:
+                content = response['body']['choices'][0]['message']['content']
+                index = int(result['custom_id'])
+                if 0 <= index < item_count:
+                    replies[index] = content.strip()
+
+    return batch.status, replies
+
+
 @app.route('/refine', methods=['POST'])
 def refine_reply():
     """Use AI to refine the email based on user feedback."""
@@ -1282,33 +1926,98 @@ def refine_reply():
     if not feedback.strip():
         return jsonify({'error': 'Please provide feedback'}), 400
 
-    try:
-        client = OpenAI()
-
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            max_tokens=1000,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"""Here is an email reply I'm drafting:
-
-{current_reply}
+    # Clients that accept an event stream get the draft token by token
+    if 'text/event-stream' in request.headers.get('Accept', ''):
+        return Response(
+            stream_refined_reply(current_reply, feedback),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
 
-Please modify this email based on the following feedback:
-{feedback}
+    try:
+        client = _get_openai_client()
 
-Return ONLY the modified email text, nothing else. Keep the same general structure and time slots unless the feedback specifically asks to change them."""
-                }
-            ]
-        )
+        response = client.chat.completions.create(**refine_request_body(current_reply, feedback))
 
         refined_reply = response.choices[0].message.content.strip()
+        if response.choices[0].finish_reason == 'length':
+            return jsonify(complete_truncated_refine(current_reply, feedback, refined_reply))
         return jsonify({'reply': refined_reply})
     except Exception as e:
         return jsonify({'error': f'AI refinement failed: {str(e)}'}), 500
 
 
+@app.route('/refine_batch', methods=['POST'])
+def refine_batch():
+    """Queue many refinements through the OpenAI Batch API (cheaper, not immediate)."""
+    data = request.json
+
+    items = data.get('items') or []
+    if not items or not isinstance(items, list):
+        return jsonify({'error': 'Please provide items to refine'}), 400
+    if len(items) > MAX_REFINE_BATCH_ITEMS:
+        return jsonify({'error': f'At most {MAX_REFINE_BATCH_ITEMS} items can be refined per batch'}), 400
+    if any(not isinstance(item, dict) or
+           not isinstance(item.get('current_reply', ''), str) or
+           not isinstance(item.get('feedback'), str) or
+           not item['feedback'].strip()
+           for item in items):
+        return jsonify({'error': 'Please provide feedback for every item'}), 400
+
+    try:
+        batch_id = submit_refine_batch(items)
+    except Exception as e:
+        return jsonify({'error': f'AI batch submission failed: {str(e)}'}), 500
+
+    # Only the session that submitted a batch may read its results; kept as
+    # [batch_id, item_count] pairs so results can be sized without the batch's counts
+    batches = session.get('refine_batches', [])
+    session['refine_batches'] = (batches + [[batch_id, len(items)]])[-MAX_SESSION_REFINE_BATCHES:]
+    return jsonify({'batch_id': batch_id, 'status': 'submitted'}), 202
+
+
+@app.route('/refine_batch/<batch_id>')
+def refine_batch_status(batch_id):
+    """Poll a refine batch; includes the refined replies once it has completed."""
+    item_count = dict(session.get('refine_batches', [])).get(batch_id)
+    if item_count is None:
+        return jsonify({'error': 'Batch not found'}), 404
+
+    try:
+        status, replies = get_refine_batch_results(batch_id, item_count)
+    except Exception as e:
+        return jsonify({'error': f'AI batch lookup failed: {str(e)}'}), 500
+
+    result = {'batch_id': batch_id, 'status': status}
+    if replies is not None:
+        result['replies'] = replies
+    return jsonify(result)
+
+
+@app.route('/calendar/prefetch')
+def calendar_prefetch():
+    """Warm the busy-times cache on page load so /generate can skip the Calendar fetch.
+
+    The cache lives in this worker process only. With several gunicorn workers
+    (gunicorn.conf.py), a later /generate served by another worker fetches again.
+    """
+    # Only use stored credentials; never start the interactive local OAuth flow from here
+    if not _has_stored_credentials():
+        return jsonify({'ok': False, 'error': 'Calendar not connected'})
+
+    try:
+        service = get_calendar_service()
+        if not service:
+            return jsonify({'ok': False, 'error': 'Calendar not connected'})
+
+        start_date, end_date = parse_date_range(request.args.get('range', 'two_weeks'))
+        get_busy_times(service, start_date, end_date)
+        return jsonify({'ok': True})
+    except Exception as e:
+        print(f"[ERROR] Calendar prefetch failed: {e}")
+        return jsonify({'ok': False, 'error': str(e)}), 500
+
+
 @app.route('/calendar/status')
 def calendar_status():
     """Check if user's calendar is connected and return connection details."""
@@ -1316,7 +2025,7 @@ def calendar_status():
         # Check if user has credentials
         has_session_creds = bool(session.get('google_credentials'))
         has_env_creds = bool(os.environ.get('GOOGLE_CREDENTIALS'))
-        has_local_creds = os.path.exists(TOKEN_PATH)
+        has_local_creds = _has_local_token()
 
         # Determine authentication mode
         auth_mode = None
@@ -1336,16 +2045,25 @@ def calendar_status():
                 'requires_auth': not has_session_creds and not has_env_creds and not has_local_creds
             }), 200
 
-        # Test API call
-        calendar = service.calendarList().list(maxResults=1).execute()
-        calendars = calendar.get('items', [])
+        # Test API call, at most once per CALENDAR_STATUS_TTL_SECONDS per credentials unless ?force=1
+        fingerprint = _service_fingerprint(service)
+        calendar_info = None
+        if fingerprint and request.args.get('force') != '1':
+            calendar_info = _CALENDAR_STATUS_CACHE.get(fingerprint)
+        if calendar_info is None:
+            calendar = service.calendarList().list(maxResults=1).execute()
+            calendars = calendar.get('items', [])
+            calendar_info = {
+                'calendar_count': len(calendars),
+                'primary_calendar': calendars[0].get('summary') if calendars else None
+            }
+            if fingerprint:
+                _CALENDAR_STATUS_CACHE.put(fingerprint, calendar_info)
 
-        return jsonify({
-            'connected': True,
-            'auth_mode': auth_mode,
-            'calendar_count': len(calendars),
-            'primary_calendar': calendars[0].get('summary') if calendars else None
-        })
+        response = jsonify({'connected': True, 'auth_mode': auth_mode, **calendar_info})
+        # Per-user (session) result, so only the browser may cache it
+        response.headers['Cache-Control'] = f'private, max-age={CALENDAR_STATUS_TTL_SECONDS}'
+        return response
     except Exception as exc:
         return jsonify({
             'connected': False,
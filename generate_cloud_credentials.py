@@ -3,7 +3,7 @@
 Generate base64-encoded credentials for cloud deployment.
 
 Run this script locally AFTER you have authenticated with Google Calendar
-(i.e., after token.pickle exists). It will output a base64 string that you
+(i.e., after token.json exists). It will output a base64 string that you
 can use as the GOOGLE_CREDENTIALS environment variable on Render.
 
 Usage:
@@ -19,8 +19,8 @@ import base64
 import os
 
 def main():
-    if not os.path.exists('token.pickle'):
-        print("Error: token.pickle not found!")
+    if not os.path.exists('token.json') and not os.path.exists('token.pickle'):
+        print("Error: token.json not found!")
         print("Please run 'python app.py' locally first to authenticate with Google Calendar.")
         return
 
@@ -29,9 +29,18 @@ def main():
         print("Please download your OAuth credentials from Google Cloud Console.")
         return
 
-    # Load the token
-    with open('token.pickle', 'rb') as f:
-        creds = pickle.load(f)
+    # Load the token (token.pickle is the format written by older versions)
+    if os.path.exists('token.json'):
+        with open('token.json', 'r') as f:
+            token_data = json.load(f)
+    else:
+        with open('token.pickle', 'rb') as f:
+            creds = pickle.load(f)
+        token_data = {
+            'token': creds.token,
+            'refresh_token': creds.refresh_token,
+            'token_uri': creds.token_uri,
+        }
 
     # Load the client credentials
     with open('credentials.json', 'r') as f:
@@ -42,9 +51,9 @@ def main():
 
     # Build the credentials object for cloud
     cloud_creds = {
-        'token': creds.token,
-        'refresh_token': creds.refresh_token,
-        'token_uri': creds.token_uri,
+        'token': token_data.get('token'),
+        'refresh_token': token_data.get('refresh_token'),
+        'token_uri': token_data.get('token_uri'),
         'client_id': client_info.get('client_id'),
         'client_secret': client_info.get('client_secret'),
     }
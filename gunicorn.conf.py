@@ -0,0 +1,27 @@
+"""
+Gunicorn settings for production (loaded automatically by `gunicorn app:app`).
+
+/generate, /compose and /refine spend most of their time blocked on Google
+Calendar and OpenAI HTTP calls, so each worker runs GUNICORN_THREADS request
+threads (gthread) to serve other requests while those calls wait. Inside a
+worker, app._AI_EXECUTOR runs the /generate email parse and calendar setup side
+by side. It is sized from the same GUNICORN_THREADS value, so every request
+thread has its slots.
+Plain threads are used rather than gevent because the app makes ordinary
+blocking calls and runs its own thread pool, which needs no monkey-patching.
+
+The app's caches (Calendar services, busy times, AI results) are per process,
+so each worker warms its own; /calendar/prefetch only helps requests that land
+on the same worker.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5050')}"
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# AI drafts and calendar reads can exceed gunicorn's 30s default
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+keepalive = 5
@@ -8,19 +8,49 @@ This script checks:
 3. Token refresh capability
 4. Calendar API access
 
+By default the token refresh and Calendar API calls are mocked, so the script
+runs offline and only checks the configuration and code paths. Pass --live to
+call Google with your real credentials.
+
 Usage:
-    python test_credentials.py
+    python test_credentials.py          # offline
+    python test_credentials.py --live   # against Google
 """
 
 import os
 import sys
 import json
 import base64
+import datetime
+import argparse
+from unittest import mock
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv('env')
 
+
+def _fake_refresh(creds, _request):
+    """Stand-in for Credentials.refresh: stamps a fake access token without a network call."""
+    creds.token = 'fake-access-token-for-offline-test-run'
+    # google-auth compares expiry against a naive UTC datetime
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    creds.expiry = now + datetime.timedelta(hours=1)
+
+
+class _FakeCalendarList:
+    def list(self, **_kwargs):
+        return self
+
+    def execute(self):
+        return {'items': [{'summary': 'Primary (fake)'}]}
+
+
+class _FakeCalendarService:
+    def calendarList(self):
+        return _FakeCalendarList()
+
+
 def test_environment_variables():
     """Test that required environment variables are set."""
     print("=" * 60)
@@ -158,11 +188,12 @@ def test_calendar_api():
     print("=" * 60)
 
     try:
-        from googleapiclient.discovery import build
-        from app import get_calendar_service
+        from app import app, get_calendar_service
 
         print("Attempting to get calendar service...")
-        service = get_calendar_service()
+        # get_calendar_service() checks the Flask session first
+        with app.test_request_context():
+            service = get_calendar_service()
 
         if not service:
             print("❌ Failed to get calendar service (returned None)")
@@ -189,20 +220,38 @@ def test_calendar_api():
         return False
 
 
+def run_tests():
+    return [
+        ("Environment Variables", test_environment_variables()),
+        ("Credential Parsing", test_credential_parsing()),
+        ("Credential Loading & Refresh", test_credential_loading()),
+        ("Calendar API Access", test_calendar_api()),
+    ]
+
+
 def main():
     """Run all tests."""
+    parser = argparse.ArgumentParser(description="Validate Google Calendar credential loading.")
+    parser.add_argument('--live', action='store_true',
+                        help="refresh the token and call the Calendar API for real")
+    args = parser.parse_args()
+
     print("\n" + "=" * 60)
     print("Google Calendar Credential Test Suite")
     print("=" * 60)
+    print(f"Mode: {'live (calls Google)' if args.live else 'offline (Google calls mocked; use --live to check against Google)'}")
     print()
 
-    results = []
-
     # Run tests
-    results.append(("Environment Variables", test_environment_variables()))
-    results.append(("Credential Parsing", test_credential_parsing()))
-    results.append(("Credential Loading & Refresh", test_credential_loading()))
-    results.append(("Calendar API Access", test_calendar_api()))
+    if args.live:
+        results = run_tests()
+    else:
+        # Only the network (and the browser-based OAuth flow) is faked; credential
+        # loading in get_calendar_service() runs for real
+        with mock.patch('google.oauth2.credentials.Credentials.refresh', _fake_refresh), \
+                mock.patch('app._build_calendar_service', lambda _creds: _FakeCalendarService()), \
+                mock.patch('app._credentials_from_local_flow', lambda: None):
+            results = run_tests()
 
     # Print summary
     print("\n" + "=" * 60)
@@ -218,7 +267,10 @@ def main():
 
     print()
     if all_passed:
-        print("🎉 All tests passed! Credentials are configured correctly.")
+        if args.live:
+            print("🎉 All tests passed! Credentials are configured correctly.")
+        else:
+            print("🎉 All offline checks passed. Run with --live to confirm the credentials work with Google.")
         sys.exit(0)
     else:
         print("⚠️  Some tests failed. Please check the errors above.")
@@ -230,6 +282,8 @@ def main():
         print("   - client_secret")
         print("3. Check that the credentials haven't been revoked in Google Cloud Console")
         print("4. Run the debug endpoint: curl http://localhost:5050/debug/credentials")
+        if not args.live:
+            print("5. Run with --live to check the credentials against Google")
         sys.exit(1)
 
 